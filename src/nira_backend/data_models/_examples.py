@@ -0,0 +1,54 @@
+"""
+JSON schema examples for the data models.
+
+Each function is used as a model's ``json_schema_extra`` callable, so the
+example payloads are only built when a JSON schema is generated rather than
+when the models are imported.
+"""
+
+from pydantic.json_schema import JsonDict
+
+
+def _measurement(time: str, value: float, unit: str) -> JsonDict:
+    return {
+        "measurement_date": "2023-10-01",
+        "measurement_time": time,
+        "value": value,
+        "unit": unit,
+    }
+
+
+def human_examples(schema: JsonDict) -> None:
+    """Add examples to the Human JSON schema."""
+    schema["examples"] = [
+        {
+            "name": "Jane Smith",
+            "gender": "female",
+            "date_of_birth": "15-05-1990",
+            "weight": 65.0,
+            "height": 165.0,
+        }
+    ]
+
+
+def weight_measurement_examples(schema: JsonDict) -> None:
+    """Add examples to the WeightMeasurement JSON schema."""
+    schema["examples"] = [_measurement("08:30:00", 70.5, "kg")]
+
+
+def length_measurement_examples(schema: JsonDict) -> None:
+    """Add examples to the LengthMeasurement JSON schema."""
+    schema["examples"] = [_measurement("09:00:00", 180.0, "cm")]
+
+
+def body_shape_measurements_examples(schema: JsonDict) -> None:
+    """Add examples to the BodyShapeMeasurements JSON schema."""
+    schema["examples"] = [
+        {
+            "neck_circumference": _measurement("08:30:00", 38.0, "cm"),
+            "waist_circumference": _measurement("08:30:00", 75.0, "cm"),
+            "hip_circumference": _measurement("08:30:00", 85.0, "cm"),
+            "wrist_circumference": _measurement("08:30:00", 17.0, "cm"),
+            "forearm_circumference": _measurement("08:30:00", 28.0, "cm"),
+        }
+    ]
@@ -0,0 +1,114 @@
+"""
+Array kernels for statistics over many humans at once.
+
+The kernels are JIT-compiled with Numba when it is installed (the ``jit``
+extra) and fall back to equivalent NumPy code otherwise. Numba is imported
+on the first call rather than at import time, so processes that never
+compute batch statistics do not pay for loading it.
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+# WHO BMI cutoffs and the category label for each interval they delimit.
+BMI_CUTOFFS = (18.5, 25.0, 30.0)
+BMI_LABELS = ("Underweight", "Normal weight", "Overweight", "Obese")
+BMI_CUTOFFS_ARRAY = np.array(BMI_CUTOFFS)
+BMI_LABELS_ARRAY = np.array(BMI_LABELS)
+
+
+def _bmi_and_category_numpy(
+    weights: npt.NDArray[np.float64],
+    heights_cm: npt.NDArray[np.float64],
+    cutoffs: npt.NDArray[np.float64],
+    out_bmi: npt.NDArray[np.float64],
+    out_cat: npt.NDArray[np.uint8],
+) -> None:
+    heights_m = heights_cm * 0.01
+    np.divide(weights, heights_m * heights_m, out=out_bmi)
+    out_cat[:] = np.searchsorted(cutoffs, out_bmi, side="right")
+
+
+# Signature shared by the NumPy and the JIT-compiled kernel.
+_BmiKernel = Callable[
+    [
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.uint8],
+    ],
+    None,
+]
+
+
+def _bmi_and_category_loop(
+    weights: npt.NDArray[np.float64],
+    heights_cm: npt.NDArray[np.float64],
+    cutoffs: npt.NDArray[np.float64],
+    out_bmi: npt.NDArray[np.float64],
+    out_cat: npt.NDArray[np.uint8],
+) -> None:
+    """
+    Fill out_bmi with BMI values and out_cat with category indices.
+
+    A category index is the number of cutoffs less than or equal to the
+    BMI, matching bisect_right over the sorted cutoffs. Written as a plain
+    loop for Numba to compile; too slow to call uncompiled.
+    """
+    n_cutoffs = cutoffs.shape[0]
+    for i in range(weights.shape[0]):
+        height_m = heights_cm[i] * 0.01
+        bmi = weights[i] / (height_m * height_m)
+        out_bmi[i] = bmi
+        category = 0
+        # Written as "not <" so that NaN lands in the top category, as with
+        # np.searchsorted and bisect_right.
+        while category < n_cutoffs and not (bmi < cutoffs[category]):
+            category += 1
+        out_cat[i] = category
+
+
+# Kernel chosen by bmi_and_category() on its first call.
+_bmi_kernel: _BmiKernel | None = None
+
+
+def bmi_and_category() -> _BmiKernel:
+    """Return the JIT-compiled kernel if Numba is installed, else the NumPy one."""
+    global _bmi_kernel
+    if _bmi_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # pragma: no cover - depends on the installed extras
+            _bmi_kernel = _bmi_and_category_numpy
+        else:
+            # NumPy's error model returns inf/NaN on division by zero instead
+            # of raising, matching the NumPy kernel.
+            _bmi_kernel = njit(cache=True, error_model="numpy")(_bmi_and_category_loop)
+    return _bmi_kernel
+
+
+def bmi_stats(
+    weights: npt.ArrayLike, heights_cm: npt.ArrayLike
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.uint8]]:
+    """
+    Calculate BMI and BMI category index for parallel 1-D arrays.
+
+    Raises:
+        ValueError: If the inputs are not 1-D or differ in shape.
+
+    Returns:
+        Tuple of (float64 BMI values, uint8 indices into BMI_LABELS)
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    heights_cm = np.asarray(heights_cm, dtype=np.float64)
+    if weights.ndim != 1:
+        raise ValueError("weights and heights_cm must be 1-D arrays")
+    if weights.shape != heights_cm.shape:
+        raise ValueError("weights and heights_cm must have the same shape")
+    bmi = np.empty(weights.shape, dtype=np.float64)
+    categories = np.empty(weights.shape, dtype=np.uint8)
+    bmi_and_category()(weights, heights_cm, BMI_CUTOFFS_ARRAY, bmi, categories)
+    return bmi, categories
@@ -0,0 +1,92 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from ._kernels import BMI_LABELS_ARRAY, bmi_stats
+from .human import Gender, Human
+
+# Gender codes stored in HumanCohort.genders, in Gender declaration order.
+_GENDERS = tuple(gender.value for gender in Gender)
+_GENDER_CODES = {gender: code for code, gender in enumerate(_GENDERS)}
+
+
+@dataclass(frozen=True, eq=False)
+class HumanCohort:
+    """
+    A group of humans stored as parallel arrays, one entry per person.
+
+    Keeping each attribute in its own contiguous array lets statistics over
+    the whole cohort run as vectorised NumPy operations instead of walking a
+    list of Human instances.
+
+    Cohorts compare and hash by identity, since the generated field-wise
+    equality cannot compare NumPy arrays.
+
+    Attributes:
+        names: Full names
+        genders: Gender codes (uint8), indices into Gender declaration order
+        dob_ordinals: Dates of birth as proleptic Gregorian ordinals (int32)
+        weights: Weights in kilograms (kg)
+        heights: Heights in centimeters (cm)
+
+    Example:
+        >>> cohort = HumanCohort.from_humans(humans)
+        >>> cohort.bmi_categories()
+    """
+
+    names: list[str]
+    genders: npt.NDArray[np.uint8]
+    dob_ordinals: npt.NDArray[np.int32]
+    weights: npt.NDArray[np.float64]
+    heights: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_humans(cls, humans: Sequence[Human]) -> "HumanCohort":
+        """Pack validated Human instances into a cohort."""
+        n = len(humans)
+        return cls(
+            names=[h.name for h in humans],
+            genders=np.fromiter(
+                (_GENDER_CODES[h.gender] for h in humans), dtype=np.uint8, count=n
+            ),
+            dob_ordinals=np.fromiter(
+                (h.date_of_birth.toordinal() for h in humans), dtype=np.int32, count=n
+            ),
+            weights=np.fromiter((h.weight for h in humans), dtype=np.float64, count=n),
+            heights=np.fromiter((h.height for h in humans), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Serialize the cohort to one dict per person, as Human.model_dump() would."""
+        return [
+            {
+                "name": name,
+                "gender": _GENDERS[gender],
+                "date_of_birth": date.fromordinal(dob_ordinal),
+                "weight": weight,
+                "height": height,
+            }
+            for name, gender, dob_ordinal, weight, height in zip(
+                self.names,
+                self.genders.tolist(),
+                self.dob_ordinals.tolist(),
+                self.weights.tolist(),
+                self.heights.tolist(),
+                strict=True,
+            )
+        ]
+
+    def bmi(self) -> npt.NDArray[np.float64]:
+        """Calculate the BMI of every person in the cohort."""
+        return bmi_stats(self.weights, self.heights)[0]
+
+    def bmi_categories(self) -> npt.NDArray[np.str_]:
+        """Get the WHO BMI category of every person in the cohort."""
+        return BMI_LABELS_ARRAY[bmi_stats(self.weights, self.heights)[1]]
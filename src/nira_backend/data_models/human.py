@@ -1,6 +1,61 @@
-from datetime import date, timedelta
-from typing import Literal
-from pydantic import BaseModel, Field, field_serializer, field_validator, ConfigDict
+import time
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from enum import StrEnum
+from typing import Annotated, Any
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+)
+
+from ._examples import human_examples
+from ._kernels import BMI_CUTOFFS, BMI_LABELS, BMI_LABELS_ARRAY, bmi_stats
+
+# Oldest accepted date of birth, expressed in days before today.
+_MAX_AGE_DAYS = 150 * 365.25
+
+# (cached date, time.time() timestamp of the next local midnight)
+_today_cache: tuple[date, float] = (date.min, float("-inf"))
+
+
+def _today() -> date:
+    """Return today's date, asking the clock again only once the cached day ends."""
+    global _today_cache
+    now = time.time()
+    if now >= _today_cache[1]:
+        today = datetime.fromtimestamp(now).date()
+        # An absolute deadline stays correct across DST changes, clock steps
+        # and suspend, unlike a duration measured on the monotonic clock.
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _today_cache = (today, midnight.timestamp())
+    return _today_cache[0]
+
+
+# Whitespace is stripped before the length check, so whitespace-only names are
+# rejected without a Python-level validator.
+_Name = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+def _format_date_of_birth(dt: date) -> str:
+    """Format a date as dd-mm-yyyy without going through strftime."""
+    return f"{dt.day:02d}-{dt.month:02d}-{dt.year:04d}"
+
+
+class Gender(StrEnum):
+    """Gender of a human."""
+    
+    MALE = "male"
+    FEMALE = "female"
+    UNDISCLOSED = "undisclosed"
 
 
 class Human(BaseModel):
@@ -25,71 +80,120 @@ class Human(BaseModel):
     """
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "name": "Jane Smith",
-                    "gender": "female",
-                    "date_of_birth": "15-05-1990",
-                    "weight": 65.0,
-                    "height": 165.0
-                }
-            ]
-        }
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        use_enum_values=True,
+        json_schema_extra=human_examples,
     )
     
-    name: str = Field(min_length=1, description="Full name of the person")
-    gender: Literal["male", "female", "undisclosed"]
-    date_of_birth: date
+    name: _Name = Field(description="Full name of the person")
+    gender: Gender
+    date_of_birth: Annotated[
+        date, PlainSerializer(_format_date_of_birth, return_type=str, when_used="json")
+    ]
     weight: float = Field(gt=0.5, le=500, description="Weight in kilograms (kg)")
     height: float = Field(ge=30, le=300, description="Height in centimeters (cm)")
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, value: str) -> str:
-        """Validate that name is not empty or just whitespace."""
-        stripped = value.strip()
-        if not stripped:
-            raise ValueError("Name cannot be empty or just whitespace")
-        return stripped
-
-    @field_serializer("date_of_birth", when_used="json")
-    def serialize_date(self, dt: date) -> str:
-        return dt.strftime("%d-%m-%Y")
-    
     @field_validator("date_of_birth")
     @classmethod
     def validate_date_of_birth(cls, value: date) -> date:
         """Validate that date of birth is not in the future and not more than 150 years ago."""
-        today = date.today()
+        today = _today()
         if value > today:
             raise ValueError("Date of birth cannot be later than today")
         
-        max_age_date = today - timedelta(days=150 * 365.25)
-        if value < max_age_date:
+        if today.toordinal() - value.toordinal() > _MAX_AGE_DAYS:
             raise ValueError("Date of birth cannot be more than 150 years ago")
         
         return value
     
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "Human":
+        """
+        Build a Human from already-validated data without running validation.
+        
+        Only use this for trusted sources such as rows previously written from
+        a validated Human. The caller must provide every field with its final
+        type: name already stripped, gender as a plain string value of Gender,
+        date_of_birth as a date, and weight and height as floats.
+        """
+        return cls.model_construct(**data)
+    
+    @classmethod
+    def validate_many(cls, raw: list[dict[str, Any]]) -> list["Human"]:
+        """
+        Validate a list of raw records into Human instances in one call.
+        
+        The whole list is validated by pydantic-core in a single pass, which
+        is cheaper than constructing each Human separately.
+        
+        Raises:
+            ValidationError: If any record is invalid; errors are located by
+                list index.
+        """
+        return _HUMAN_LIST_ADAPTER.validate_python(raw)
+    
     def get_age(self) -> int:
         """Calculate the age of the human based on the date of birth."""
-        today = date.today()
-        age = today.year - self.date_of_birth.year
-        # Adjust if birthday hasn't occurred yet this year
-        if (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day):
-            age -= 1
-        return age
+        today = _today()
+        dob = self.date_of_birth
+        # Subtract one if the birthday hasn't occurred yet this year; month and
+        # day are compared as a single mmdd integer.
+        return today.year - dob.year - (
+            today.month * 100 + today.day < dob.month * 100 + dob.day
+        )
     
     @property
     def bmi(self) -> float:
         """
         Calculate Body Mass Index (BMI).
         
+        The value is not rounded; round it where it is presented.
+        
         Returns:
             BMI value calculated as weight (kg) / (height (m))^2
         """
-        height_in_meters = self.height / 100
-        return round(self.weight / (height_in_meters ** 2), 2)
+        height_in_meters = self.height * 0.01
+        return self.weight / (height_in_meters * height_in_meters)
+    
+    @staticmethod
+    def bmi_batch(
+        weights: npt.ArrayLike, heights_cm: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        """
+        Calculate BMI for many people at once.
+        
+        Args:
+            weights: 1-D array of weights in kilograms (kg)
+            heights_cm: Heights in centimeters (cm), same shape as weights
+        
+        Raises:
+            ValueError: If the inputs are not 1-D or differ in shape.
+        
+        Returns:
+            float64 array of BMI values, element-wise weight / (height (m))^2
+        """
+        return bmi_stats(weights, heights_cm)[0]
+    
+    @staticmethod
+    def stats_batch(
+        humans: Sequence["Human"],
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.str_]]:
+        """
+        Calculate BMI and BMI category for many humans in one pass.
+        
+        Weights and heights are gathered into arrays once and processed by the
+        same kernel as bmi_batch (JIT-compiled when Numba is installed).
+        
+        Returns:
+            Tuple of (BMI values, BMI category strings), one entry per human
+        """
+        n = len(humans)
+        weights = np.fromiter((h.weight for h in humans), dtype=np.float64, count=n)
+        heights = np.fromiter((h.height for h in humans), dtype=np.float64, count=n)
+        bmi, categories = bmi_stats(weights, heights)
+        return bmi, BMI_LABELS_ARRAY[categories]
     
     @property
     def bmi_category(self) -> str:
@@ -99,12 +203,7 @@ class Human(BaseModel):
         Returns:
             BMI category string
         """
-        bmi_value = self.bmi
-        if bmi_value < 18.5:
-            return "Underweight"
-        elif bmi_value < 25:
-            return "Normal weight"
-        elif bmi_value < 30:
-            return "Overweight"
-        else:
-            return "Obese"
+        return BMI_LABELS[bisect_right(BMI_CUTOFFS, self.bmi)]
+
+
+_HUMAN_LIST_ADAPTER = TypeAdapter(list[Human])
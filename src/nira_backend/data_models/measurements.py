@@ -1,13 +1,60 @@
 from datetime import date, timedelta
-from typing import Literal, Optional
-from pydantic import BaseModel, Field, field_serializer, field_validator, ConfigDict
+from enum import StrEnum
+from typing import ClassVar, Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+)
+
+from ._examples import (
+    body_shape_measurements_examples,
+    length_measurement_examples,
+    weight_measurement_examples,
+)
+
+# Conversion factors from each supported unit to the canonical unit. Validated
+# units are always the enum members' interned literal values (use_enum_values),
+# so lookups hit the identity fast path of the key comparison.
+_TO_KG = {"kg": 1.0, "lb": 0.453592, "g": 0.001}
+_TO_CM = {"cm": 1.0, "m": 100.0, "in": 2.54, "ft": 30.48}
+
+
+class MassUnit(StrEnum):
+    """Units accepted for weight measurements."""
+    
+    KG = "kg"
+    LB = "lb"
+    G = "g"
+
+
+class LengthUnit(StrEnum):
+    """Units accepted for length measurements."""
+    
+    CM = "cm"
+    M = "m"
+    IN = "in"
+    FT = "ft"
 
 
 class BaseMeasurement(BaseModel):
     """
     Base class for measurement quantities like length, mass, volume, etc.
+    
+    Measurements are immutable once validated; the subclasses' to_* methods
+    return unit-normalised copies instead of changing the instance.
     """
     
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        use_enum_values=True,
+    )
+    
     measurement_date: date = Field(description="Date of the measurement")
     measurement_time: timedelta = Field(description="Time of the measurement since midnight")
     value: float = Field(description="Value of the measurement")
@@ -34,37 +81,33 @@ class WeightMeasurement(BaseMeasurement):
         ... )
     """
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "measurement_date": "2023-10-01",
-                    "measurement_time": "08:30:00",
-                    "value": 70.5,
-                    "unit": "kg"
-                }
-            ]
-        }
-    )
+    model_config = ConfigDict(json_schema_extra=weight_measurement_examples)
     value: float = Field(gt=0.5, le=150, description="Weight value")
-    unit: Literal["kg", "lb", "g"] = Field(default="kg", description="Unit of the measurement (kg)")
+    unit: MassUnit = Field(
+        default=MassUnit.KG,
+        validate_default=True,
+        description="Unit of the measurement (kg)",
+    )
     
     def convert_to_kg(self) -> float:
         """Convert the measurement to kilograms (kg)."""
-        if self.unit == "kg":
-            return self.value
-        elif self.unit == "lb":
-            return self.value * 0.453592
-        elif self.unit == "g":
-            return self.value / 1000
-        else:
-            raise ValueError(f"Unsupported unit for weight conversion: {self.unit}")
+        try:
+            return self.value * _TO_KG[self.unit]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported unit for weight conversion: {self.unit}"
+            ) from None
         
-    def set_unit_to_kg(self) -> None:
-        """Set the unit to kilograms (kg) and convert the value accordingly."""
-        if self.unit != "kg":
-            self.value = self.convert_to_kg()
-            self.unit = "kg"
+    def to_kg(self) -> "WeightMeasurement":
+        """Return the measurement in kilograms (kg), as a converted copy if needed."""
+        unit = self.unit
+        if unit == "kg":
+            return self
+        # The value was validated on construction and the factor is trusted,
+        # so the copy skips validation.
+        return self.model_copy(
+            update={"value": self.value * _TO_KG[unit], "unit": "kg"}
+        )
 
 
 class LengthMeasurement(BaseMeasurement):
@@ -80,39 +123,33 @@ class LengthMeasurement(BaseMeasurement):
         ... )
     """
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "measurement_date": "2023-10-01",
-                    "measurement_time": "09:00:00",
-                    "value": 180.0,
-                    "unit": "cm"
-                }
-            ]
-        }
-    )
+    model_config = ConfigDict(json_schema_extra=length_measurement_examples)
     value: float = Field(ge=30, le=300, description="Length value")
-    unit: Literal["cm", "m", "in", "ft"] = Field(default="cm", description="Unit of the measurement (cm)")
+    unit: LengthUnit = Field(
+        default=LengthUnit.CM,
+        validate_default=True,
+        description="Unit of the measurement (cm)",
+    )
     
     def convert_to_cm(self) -> float:
         """Convert the measurement to centimeters (cm)."""
-        if self.unit == "cm":
-            return self.value
-        elif self.unit == "m":
-            return self.value * 100
-        elif self.unit == "in":
-            return self.value * 2.54
-        elif self.unit == "ft":
-            return self.value * 30.48
-        else:
-            raise ValueError(f"Unsupported unit for length conversion: {self.unit}")
+        try:
+            return self.value * _TO_CM[self.unit]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported unit for length conversion: {self.unit}"
+            ) from None
         
-    def set_unit_to_cm(self) -> None:
-        """Set the unit to centimeters (cm) and convert the value accordingly."""
-        if self.unit != "cm":
-            self.value = self.convert_to_cm()
-            self.unit = "cm"
+    def to_cm(self) -> "LengthMeasurement":
+        """Return the measurement in centimeters (cm), as a converted copy if needed."""
+        unit = self.unit
+        if unit == "cm":
+            return self
+        # The value was validated on construction and the factor is trusted,
+        # so the copy skips validation.
+        return self.model_copy(
+            update={"value": self.value * _TO_CM[unit], "unit": "cm"}
+        )
 
 
 class BodyShapeMeasurements(BaseModel):
@@ -162,44 +199,20 @@ class BodyShapeMeasurements(BaseModel):
     """
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "neck_circumference": {
-                        "measurement_date": "2023-10-01",
-                        "measurement_time": "08:30:00",
-                        "value": 38.0,
-                        "unit": "cm"
-                    },
-                    "waist_circumference": {
-                        "measurement_date": "2023-10-01",
-                        "measurement_time": "08:30:00",
-                        "value": 75.0,
-                        "unit": "cm"
-                    },
-                    "hip_circumference": {
-                        "measurement_date": "2023-10-01",
-                        "measurement_time": "08:30:00",
-                        "value": 85.0,
-                        "unit": "cm"
-                    },
-                    "wrist_circumference": {
-                        "measurement_date": "2023-10-01",
-                        "measurement_time": "08:30:00",
-                        "value": 17.0,
-                        "unit": "cm"
-                    },
-                    "forearm_circumference": {
-                        "measurement_date": "2023-10-01",
-                        "measurement_time": "08:30:00",
-                        "value": 28.0,
-                        "unit": "cm"
-                    }
-                }
-            ]
-        }
+        frozen=True,
+        validate_assignment=False,
+        json_schema_extra=body_shape_measurements_examples,
     )
     
+    # Allowed range in cm for each range-checked field; other fields are only
+    # converted to cm.
+    _BOUNDS: ClassVar[dict[str, tuple[int, int]]] = {
+        "neck_circumference": (8, 60),
+        "waist_circumference": (20, 150),
+        "hip_circumference": (20, 200),
+        "wrist_circumference": (5, 40),
+    }
+
     neck_circumference: Optional[LengthMeasurement] = Field(default=None, description="Neck circumference")
     waist_circumference: Optional[LengthMeasurement] = Field(default=None, description="Waist circumference")
     hip_circumference: Optional[LengthMeasurement] = Field(default=None, description="Hip circumference")
@@ -207,31 +220,19 @@ class BodyShapeMeasurements(BaseModel):
     forearm_circumference: Optional[LengthMeasurement] = Field(default=None, description="Forearm circumference")
 
     @field_validator("*", mode="after")
-    def set_measurement_in_cm(cls, bodyshape: Optional[LengthMeasurement]) -> Optional[LengthMeasurement]:
-        if bodyshape is not None:
-            bodyshape.set_unit_to_cm()
-        return bodyshape
-
-    @field_validator("neck_circumference", mode="after")
-    def validate_neck(cls, neck: Optional[LengthMeasurement]) -> Optional[LengthMeasurement]:
-        if neck is not None and not (8 <= neck.convert_to_cm() <= 60):
-            raise ValueError("Neck circumference must be between 8 cm and 60 cm")
-        return neck
-    
-    @field_validator("waist_circumference", mode="after")
-    def validate_waist(cls, waist: Optional[LengthMeasurement]) -> Optional[LengthMeasurement]:
-        if waist is not None and not (20 <= waist.convert_to_cm() <= 150):
-            raise ValueError("Waist circumference must be between 20 cm and 150 cm")
-        return waist
-    
-    @field_validator("hip_circumference", mode="after")
-    def validate_hip(cls, hip: Optional[LengthMeasurement]) -> Optional[LengthMeasurement]:
-        if hip is not None and not (20 <= hip.convert_to_cm() <= 200):
-            raise ValueError("Hip circumference must be between 20 cm and 200 cm")
-        return hip
-    
-    @field_validator("wrist_circumference", mode="after")
-    def validate_wrist(cls, wrist: Optional[LengthMeasurement]) -> Optional[LengthMeasurement]:
-        if wrist is not None and not (5 <= wrist.convert_to_cm() <= 40):
-            raise ValueError("Wrist circumference must be between 5 cm and 40 cm")
-        return wrist
\ No newline at end of file
+    @classmethod
+    def validate_measurement(
+        cls, measurement: Optional[LengthMeasurement], info: ValidationInfo
+    ) -> Optional[LengthMeasurement]:
+        """Convert a measurement to cm and check it against its field's range."""
+        if measurement is None:
+            return None
+        measurement = measurement.to_cm()
+        name = info.field_name or ""
+        bounds = cls._BOUNDS.get(name)
+        if bounds is not None:
+            low, high = bounds
+            if not (low <= measurement.value <= high):
+                label = name.replace("_", " ").capitalize()
+                raise ValueError(f"{label} must be between {low} cm and {high} cm")
+        return measurement
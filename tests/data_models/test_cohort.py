@@ -0,0 +1,81 @@
+"""Tests for the HumanCohort container."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from nira_backend.data_models.cohort import HumanCohort
+from nira_backend.data_models.human import Human
+
+
+@pytest.fixture
+def humans():
+    """Humans covering every gender and BMI category boundary."""
+    return [
+        Human(
+            name="Thin Person",
+            gender="male",
+            date_of_birth=date(1990, 5, 15),
+            weight=50.0,
+            height=175.0,
+        ),
+        Human(
+            name="Normal Person",
+            gender="female",
+            date_of_birth=date(1985, 12, 25),
+            weight=65.3,
+            height=165.0,
+        ),
+        Human(
+            name="Boundary Person",
+            gender="undisclosed",
+            date_of_birth=date(2000, 2, 29),
+            weight=100.0,
+            height=200.0,
+        ),
+    ]
+
+
+class TestHumanCohort:
+    """Tests for HumanCohort."""
+
+    def test_from_humans_packs_arrays(self, humans):
+        """Test that fields are packed into typed parallel arrays."""
+        cohort = HumanCohort.from_humans(humans)
+        assert len(cohort) == 3
+        assert cohort.names == ["Thin Person", "Normal Person", "Boundary Person"]
+        assert cohort.genders.dtype == np.uint8
+        assert cohort.genders.tolist() == [0, 1, 2]
+        assert cohort.dob_ordinals.dtype == np.int32
+        assert cohort.weights.tolist() == [50.0, 65.3, 100.0]
+
+    def test_to_dicts_round_trips(self, humans):
+        """Test that serializing a cohort matches dumping each Human."""
+        cohort = HumanCohort.from_humans(humans)
+        assert cohort.to_dicts() == [h.model_dump() for h in humans]
+
+    def test_bmi_matches_human(self, humans):
+        """Test that cohort BMI matches the per-instance BMI."""
+        cohort = HumanCohort.from_humans(humans)
+        assert cohort.bmi().tolist() == [h.bmi for h in humans]
+
+    def test_bmi_categories_match_human(self, humans):
+        """Test that cohort BMI categories match the per-instance categories."""
+        cohort = HumanCohort.from_humans(humans)
+        assert cohort.bmi_categories().tolist() == [h.bmi_category for h in humans]
+
+    def test_empty_cohort(self):
+        """Test that an empty cohort has empty arrays."""
+        cohort = HumanCohort.from_humans([])
+        assert len(cohort) == 0
+        assert cohort.to_dicts() == []
+        assert cohort.bmi_categories().shape == (0,)
+
+    def test_compares_and_hashes_by_identity(self, humans):
+        """Test that cohorts with equal arrays compare by identity without raising."""
+        cohort = HumanCohort.from_humans(humans)
+        other = HumanCohort.from_humans(humans)
+        assert cohort == cohort
+        assert cohort != other
+        assert len({cohort, other}) == 2
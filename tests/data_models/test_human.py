@@ -1,8 +1,13 @@
 """Tests for the Human data model."""
+import os
+import time
+import numpy as np
 import pytest
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
 from pydantic import ValidationError
-from nira_backend.data_models.human import Human
+from nira_backend.data_models import human as human_module
+from nira_backend.data_models.human import Gender, Human
 
 
 class TestHumanCreation:
@@ -45,6 +50,30 @@ class TestHumanCreation:
         )
         assert human.gender == "undisclosed"
 
+    def test_human_is_immutable(self):
+        """Test that fields cannot be reassigned after creation."""
+        human = Human(
+            name="John Doe",
+            gender="male",
+            date_of_birth=date(1990, 5, 15),
+            weight=75.5,
+            height=175.0
+        )
+        with pytest.raises(ValidationError):
+            human.weight = 80.0
+
+    def test_extra_fields_raise_error(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValidationError):
+            Human(
+                name="John Doe",
+                gender="male",
+                date_of_birth=date(1990, 5, 15),
+                weight=75.5,
+                height=175.0,
+                nickname="JD"
+            )
+
 
 class TestHumanNameValidation:
     """Tests for name validation."""
@@ -59,8 +88,7 @@ class TestHumanNameValidation:
                 weight=75.5,
                 height=175.0
             )
-        # Empty string caught by min_length validation first
-        assert "at least 1 character" in str(exc_info.value)
+        assert any("at least 1 character" in e["msg"] for e in exc_info.value.errors())
     
     def test_name_cannot_be_whitespace_only(self):
         """Test that name cannot be only whitespace."""
@@ -72,7 +100,8 @@ class TestHumanNameValidation:
                 weight=75.5,
                 height=175.0
             )
-        assert "Name cannot be empty or just whitespace" in str(exc_info.value)
+        # Whitespace is stripped before the min_length check
+        assert any("at least 1 character" in e["msg"] for e in exc_info.value.errors())
     
     def test_name_strips_whitespace(self):
         """Test that name is stripped of leading/trailing whitespace."""
@@ -89,6 +118,18 @@ class TestHumanNameValidation:
 class TestHumanGenderValidation:
     """Tests for gender validation."""
     
+    def test_gender_enum_member_stored_as_value(self):
+        """Test that a Gender member is accepted and stored as its plain value."""
+        human = Human(
+            name="John Doe",
+            gender=Gender.MALE,
+            date_of_birth=date(1990, 5, 15),
+            weight=75.5,
+            height=175.0
+        )
+        assert type(human.gender) is str
+        assert human.gender == "male"
+
     def test_invalid_gender_raises_error(self):
         """Test that invalid gender raises ValidationError."""
         with pytest.raises(ValidationError):
@@ -115,7 +156,10 @@ class TestHumanDateOfBirthValidation:
                 weight=75.5,
                 height=175.0
             )
-        assert "Date of birth cannot be later than today" in str(exc_info.value)
+        assert any(
+            "Date of birth cannot be later than today" in e["msg"]
+            for e in exc_info.value.errors()
+        )
     
     def test_too_old_date_raises_error(self):
         """Test that date of birth more than 150 years ago raises error."""
@@ -128,8 +172,23 @@ class TestHumanDateOfBirthValidation:
                 weight=75.5,
                 height=175.0
             )
-        assert "Date of birth cannot be more than 150 years ago" in str(exc_info.value)
-    
+        assert any(
+            "Date of birth cannot be more than 150 years ago" in e["msg"]
+            for e in exc_info.value.errors()
+        )
+
+    def test_oldest_valid_date(self):
+        """Test that a date of birth exactly at the 150 year limit is valid."""
+        oldest_date = date.today() - timedelta(days=54787)
+        human = Human(
+            name="John Doe",
+            gender="male",
+            date_of_birth=oldest_date,
+            weight=75.5,
+            height=175.0
+        )
+        assert human.date_of_birth == oldest_date
+
     def test_today_date_is_valid(self):
         """Test that today's date is valid for date of birth."""
         human = Human(
@@ -142,6 +201,75 @@ class TestHumanDateOfBirthValidation:
         assert human.date_of_birth == date.today()
 
 
+def _pin_clock(monkeypatch, wall):
+    """Make _today() see the given local wall-clock datetime as the current time."""
+    clock = SimpleNamespace(time=wall.timestamp)
+    monkeypatch.setattr(human_module, "time", clock)
+
+
+@pytest.fixture
+def new_york_tz():
+    """Switch the process local time zone to America/New_York for one test."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    saved = os.environ.get("TZ")
+    os.environ["TZ"] = "America/New_York"
+    time.tzset()
+    try:
+        # Without the tz database the zone silently falls back to UTC.
+        if time.tzname != ("EST", "EDT"):
+            pytest.skip("the America/New_York time zone is not available")
+        yield
+    finally:
+        if saved is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = saved
+        time.tzset()
+
+
+class TestTodayCache:
+    """Tests for the cached current date used by validation and age calculation."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        """Start every test with an expired cache entry."""
+        monkeypatch.setattr(human_module, "_today_cache", (date.min, float("-inf")))
+
+    def test_cached_date_is_reused_before_deadline(self, monkeypatch):
+        """Test that the cached date is returned without asking the clock."""
+        _pin_clock(monkeypatch, datetime(2026, 5, 1, 12, 0))
+        cache = (date(2000, 1, 1), datetime(2026, 5, 1, 12, 1).timestamp())
+        monkeypatch.setattr(human_module, "_today_cache", cache)
+        assert human_module._today() == date(2000, 1, 1)
+
+    def test_cached_date_is_refreshed_at_deadline(self, monkeypatch):
+        """Test that the cached date is replaced once its day has ended."""
+        _pin_clock(monkeypatch, datetime(2026, 5, 1, 23, 59, 59))
+        assert human_module._today() == date(2026, 5, 1)
+        _pin_clock(monkeypatch, datetime(2026, 5, 2, 0, 0))
+        assert human_module._today() == date(2026, 5, 2)
+
+    def test_deadline_is_next_midnight(self, monkeypatch):
+        """Test that a refreshed entry stays valid until the next midnight only."""
+        _pin_clock(monkeypatch, datetime(2026, 5, 1, 18, 30))
+        human_module._today()
+        assert human_module._today_cache == (
+            date(2026, 5, 1),
+            datetime(2026, 5, 2, 0, 0).timestamp(),
+        )
+
+    def test_deadline_across_spring_forward(self, monkeypatch, new_york_tz):
+        """Test that the day lost to a DST change does not delay the refresh."""
+        # 2026-03-08 has only 23 hours in America/New_York.
+        _pin_clock(monkeypatch, datetime(2026, 3, 8, 0, 0, 5))
+        assert human_module._today() == date(2026, 3, 8)
+        now = datetime(2026, 3, 8, 0, 0, 5).timestamp()
+        assert human_module._today_cache[1] - now == 82795
+        _pin_clock(monkeypatch, datetime(2026, 3, 9, 0, 0, 1))
+        assert human_module._today() == date(2026, 3, 9)
+
+
 class TestHumanWeightValidation:
     """Tests for weight validation."""
     
@@ -253,7 +381,20 @@ class TestHumanAgeCalculation:
         )
         expected_age = date.today().year - 1990
         assert human.get_age() == expected_age
-    
+
+    def test_age_calculation_birthday_tomorrow(self):
+        """Test age calculation when the birthday is tomorrow."""
+        tomorrow = date.today() + timedelta(days=1)
+        # 28 years keeps a 29 February birthday on a leap year
+        human = Human(
+            name="John Doe",
+            gender="male",
+            date_of_birth=tomorrow.replace(year=tomorrow.year - 28),
+            weight=75.5,
+            height=175.0
+        )
+        assert human.get_age() == 27
+
     def test_age_calculation_for_newborn(self):
         """Test age calculation for someone born today."""
         human = Human(
@@ -279,8 +420,71 @@ class TestHumanBMI:
             height=175.0
         )
         # BMI = 75 / (1.75^2) = 24.49
-        assert human.bmi == 24.49
-    
+        assert human.bmi == pytest.approx(24.49, abs=0.01)
+
+    def test_bmi_follows_model_copy_update(self):
+        """Test that BMI reflects updated fields on a copied instance."""
+        human = Human(
+            name="John Doe",
+            gender="male",
+            date_of_birth=date(1990, 5, 15),
+            weight=75.0,
+            height=175.0
+        )
+        assert human.bmi_category == "Normal weight"
+        heavier = human.model_copy(update={"weight": 100.0})
+        assert heavier.bmi == pytest.approx(32.65, abs=0.01)
+        assert heavier.bmi_category == "Obese"
+        assert "bmi" not in heavier.model_dump()
+
+    def test_bmi_batch(self):
+        """Test vectorised BMI calculation over arrays of weights and heights."""
+        bmi = Human.bmi_batch(np.array([75.0, 100.0]), np.array([175.0, 200.0]))
+        assert bmi.dtype == np.float64
+        assert bmi.tolist() == pytest.approx([24.49, 25.0], abs=0.01)
+
+    def test_bmi_batch_rejects_mismatched_shapes(self):
+        """Test that weights and heights must pair up one to one."""
+        with pytest.raises(ValueError, match="same shape"):
+            Human.bmi_batch([75.0, 100.0], [175.0])
+
+    @pytest.mark.parametrize(
+        "weights, heights",
+        [
+            (np.full((2, 2), 75.0), np.full((2, 2), 175.0)),
+            (75.0, 175.0),
+        ],
+        ids=["2-D", "scalar"],
+    )
+    def test_bmi_batch_rejects_non_1d_input(self, weights, heights):
+        """Test that only 1-D inputs are accepted, with or without Numba."""
+        with pytest.raises(ValueError, match="1-D"):
+            Human.bmi_batch(weights, heights)
+
+    def test_stats_batch_matches_scalar_properties(self):
+        """Test that batch BMI and categories match the per-instance properties."""
+        humans = [
+            Human(
+                name="Person",
+                gender="undisclosed",
+                date_of_birth=date(1990, 5, 15),
+                weight=weight,
+                height=height
+            )
+            for weight, height in [
+                (50.0, 175.0), (70.0, 175.0), (100.0, 200.0), (100.0, 175.0)
+            ]
+        ]
+        bmi, categories = Human.stats_batch(humans)
+        assert bmi.tolist() == pytest.approx([h.bmi for h in humans])
+        assert categories.tolist() == [h.bmi_category for h in humans]
+
+    def test_stats_batch_empty(self):
+        """Test that an empty batch returns empty arrays."""
+        bmi, categories = Human.stats_batch([])
+        assert bmi.shape == (0,)
+        assert categories.shape == (0,)
+
     def test_bmi_underweight_category(self):
         """Test BMI category for underweight."""
         human = Human(
@@ -325,6 +529,18 @@ class TestHumanBMI:
         )
         assert human.bmi_category == "Obese"
 
+    def test_bmi_category_boundary_belongs_to_upper_category(self):
+        """Test that a BMI exactly on a cutoff falls in the higher category."""
+        human = Human(
+            name="Boundary Person",
+            gender="male",
+            date_of_birth=date(1990, 5, 15),
+            weight=100.0,
+            height=200.0
+        )
+        # BMI = 100 / (2.0^2) = 25.0
+        assert human.bmi_category == "Overweight"
+
 
 class TestHumanSerialization:
     """Tests for serialization."""
@@ -340,6 +556,17 @@ class TestHumanSerialization:
         )
         json_data = human.model_dump(mode="json")
         assert json_data["date_of_birth"] == "15-05-1990"
+
+    def test_date_of_birth_serialization_pads_day_and_month(self):
+        """Test that single-digit days and months are zero padded."""
+        human = Human(
+            name="John Doe",
+            gender="male",
+            date_of_birth=date(1990, 1, 5),
+            weight=75.5,
+            height=175.0
+        )
+        assert '"date_of_birth":"05-01-1990"' in human.model_dump_json()
     
     def test_full_serialization(self):
         """Test full model serialization to dict."""
@@ -355,3 +582,78 @@ class TestHumanSerialization:
         assert data["gender"] == "female"
         assert data["weight"] == 65.0
         assert data["height"] == 165.0
+
+
+class TestHumanJsonSchema:
+    """Tests for the generated JSON schema."""
+
+    def test_json_schema_includes_example(self):
+        """Test that the JSON schema carries a valid example payload."""
+        examples = Human.model_json_schema()["examples"]
+        assert examples[0]["name"] == "Jane Smith"
+        assert Human.model_validate({**examples[0], "date_of_birth": date(1990, 5, 15)})
+
+
+class TestHumanBulkValidation:
+    """Tests for validating many Human records at once."""
+
+    def test_validate_many(self):
+        """Test that a list of records is validated into Human instances."""
+        humans = Human.validate_many([
+            {
+                "name": "John Doe",
+                "gender": "male",
+                "date_of_birth": date(1990, 5, 15),
+                "weight": 75.5,
+                "height": 175.0
+            },
+            {
+                "name": " Jane Smith ",
+                "gender": "female",
+                "date_of_birth": "1985-12-25",
+                "weight": 65.0,
+                "height": 165.0
+            },
+        ])
+        assert [type(h) for h in humans] == [Human, Human]
+        assert humans[1].name == "Jane Smith"
+        assert humans[1].date_of_birth == date(1985, 12, 25)
+
+    def test_validate_many_reports_invalid_record_index(self):
+        """Test that errors point at the index of the invalid record."""
+        with pytest.raises(ValidationError) as exc_info:
+            Human.validate_many([
+                {
+                    "name": "John Doe",
+                    "gender": "male",
+                    "date_of_birth": date(1990, 5, 15),
+                    "weight": 75.5,
+                    "height": 175.0
+                },
+                {
+                    "name": "Jane Smith",
+                    "gender": "other",
+                    "date_of_birth": date(1985, 12, 25),
+                    "weight": 65.0,
+                    "height": 165.0
+                },
+            ])
+        assert exc_info.value.errors()[0]["loc"][:2] == (1, "gender")
+
+
+class TestHumanTrustedConstruction:
+    """Tests for constructing Human instances from trusted data."""
+
+    def test_from_trusted(self):
+        """Test building a Human from trusted data skips validation."""
+        human = Human.from_trusted(
+            name="  x ",
+            gender="male",
+            date_of_birth=date(1990, 5, 15),
+            weight=0.1,
+            height=175.0
+        )
+        # Validation would strip the name and reject the weight.
+        assert human.name == "  x "
+        assert human.weight == 0.1
+        assert human.bmi == pytest.approx(0.1 / 1.75**2)
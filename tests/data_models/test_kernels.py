@@ -0,0 +1,72 @@
+"""Tests for the batch BMI kernels."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from nira_backend.data_models import _kernels
+
+# Weights at 200 cm whose BMI falls just below and exactly on each WHO cutoff.
+_WEIGHTS = np.array([73.9, 74.0, 99.9, 100.0, 119.9, 120.0])
+_HEIGHTS = np.full(_WEIGHTS.shape, 200.0)
+_CATEGORIES = [0, 1, 1, 2, 2, 3]
+# Boundary inputs plus a zero height (BMI inf) and a NaN weight (BMI NaN); both
+# fall in the top category, as with bisect_right over the cutoffs.
+_EDGE_WEIGHTS = np.append(_WEIGHTS, [70.0, np.nan])
+_EDGE_HEIGHTS = np.append(_HEIGHTS, [0.0, 175.0])
+_EDGE_CATEGORIES = _CATEGORIES + [3, 3]
+
+
+def _run(kernel, weights=_WEIGHTS, heights=_HEIGHTS):
+    """Run a kernel over the given inputs and return (bmi, categories)."""
+    bmi = np.empty(weights.shape, dtype=np.float64)
+    categories = np.empty(weights.shape, dtype=np.uint8)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kernel(weights, heights, _kernels.BMI_CUTOFFS_ARRAY, bmi, categories)
+    return bmi, categories
+
+
+class TestBmiAndCategory:
+    """Tests for the bmi_and_category kernels."""
+
+    def test_numpy_kernel_categories_at_cutoffs(self):
+        """Test that a BMI exactly on a cutoff falls in the upper category."""
+        bmi, categories = _run(_kernels._bmi_and_category_numpy)
+        assert bmi[1::2].tolist() == [18.5, 25.0, 30.0]
+        assert categories.tolist() == _CATEGORIES
+
+    def test_numba_kernel_matches_numpy(self):
+        """Test that the JIT-compiled kernel agrees exactly with the NumPy one."""
+        pytest.importorskip("numba")
+        kernel = _kernels.bmi_and_category()
+        assert kernel is not _kernels._bmi_and_category_numpy
+        jit_bmi, jit_categories = _run(kernel, _EDGE_WEIGHTS, _EDGE_HEIGHTS)
+        np_bmi, np_categories = _run(
+            _kernels._bmi_and_category_numpy, _EDGE_WEIGHTS, _EDGE_HEIGHTS
+        )
+        np.testing.assert_array_equal(jit_bmi, np_bmi)
+        assert np.isinf(jit_bmi[-2]) and np.isnan(jit_bmi[-1])
+        assert jit_categories.tolist() == _EDGE_CATEGORIES
+        assert np_categories.tolist() == _EDGE_CATEGORIES
+
+    def test_loop_kernel_matches_numpy(self):
+        """Test that the loop Numba compiles agrees with NumPy when run as Python."""
+        loop_bmi, loop_categories = _run(
+            _kernels._bmi_and_category_loop, _EDGE_WEIGHTS, _EDGE_HEIGHTS
+        )
+        np_bmi, _ = _run(_kernels._bmi_and_category_numpy, _EDGE_WEIGHTS, _EDGE_HEIGHTS)
+        np.testing.assert_array_equal(loop_bmi, np_bmi)
+        assert loop_categories.tolist() == _EDGE_CATEGORIES
+
+    def test_importing_human_does_not_import_numba(self):
+        """Test that Numba is only loaded when a batch kernel is first used."""
+        code = (
+            "import sys, nira_backend.data_models.human; "
+            "print('numba' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
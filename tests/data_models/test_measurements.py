@@ -1,4 +1,5 @@
 """Tests for the measurements data models."""
+import sys
 import pytest
 from datetime import date, timedelta
 from pydantic import ValidationError
@@ -6,9 +7,70 @@ from nira_backend.data_models.measurements import (
     BaseMeasurement,
     WeightMeasurement,
     LengthMeasurement,
-    BodyShapeMeasurements
+    BodyShapeMeasurements,
+    MassUnit,
 )
 
+_DATE = date(2023, 10, 1)
+_TIME_8_30 = timedelta(hours=8, minutes=30)
+_TIME_9_00 = timedelta(hours=9)
+# Absolute tolerance for converted values
+_TOL = 1e-3
+# Range error message for each BodyShapeMeasurements field
+_RANGE_MSGS = {
+    "neck_circumference": "Neck circumference must be between 8 cm and 60 cm",
+    "waist_circumference": "Waist circumference must be between 20 cm and 150 cm",
+    "hip_circumference": "Hip circumference must be between 20 cm and 200 cm",
+    "wrist_circumference": "Wrist circumference must be between 5 cm and 40 cm",
+}
+
+
+def _mk_length(value, unit="cm"):
+    """
+    Build a LengthMeasurement without running its validators.
+    
+    For tests of BodyShapeMeasurements, whose own validation is under test;
+    LengthMeasurement validation is covered by TestLengthMeasurement.
+    """
+    return LengthMeasurement.model_construct(
+        measurement_date=_DATE,
+        measurement_time=_TIME_8_30,
+        value=value,
+        unit=unit
+    )
+
+
+# cm measurements shared by the success-path BodyShapeMeasurements tests;
+# measurements are immutable, so sharing them is safe.
+_NECK = _mk_length(40.0)
+_WAIST = _mk_length(80.0)
+_HIP = _mk_length(90.0)
+_WRIST = _mk_length(38.0)
+_FOREARM = _mk_length(30.0)
+_VALID_BODY = BodyShapeMeasurements(
+    neck_circumference=_NECK,
+    waist_circumference=_WAIST,
+    hip_circumference=_HIP,
+    wrist_circumference=_WRIST,
+    forearm_circumference=_FOREARM
+)
+_PARTIAL_BODY = BodyShapeMeasurements(waist_circumference=_WAIST)
+
+
+@pytest.fixture(scope="module")
+def lengths():
+    """cm measurements just above each BodyShapeMeasurements field's upper bound."""
+    values = {"neck61": 61.0, "waist151": 151.0, "hip201": 201.0, "wrist41": 41.0}
+    return {
+        key: LengthMeasurement(
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
+            value=value,
+            unit="cm"
+        )
+        for key, value in values.items()
+    }
+
 
 class TestBaseMeasurement:
     """Tests for BaseMeasurement class."""
@@ -16,13 +78,13 @@ class TestBaseMeasurement:
     def test_create_valid_base_measurement(self):
         """Test creating a valid BaseMeasurement instance."""
         measurement = BaseMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
             value=100.0,
             unit="kg"
         )
-        assert measurement.measurement_date == date(2023, 10, 1)
-        assert measurement.measurement_time == timedelta(hours=8, minutes=30)
+        assert measurement.measurement_date == _DATE
+        assert measurement.measurement_time == _TIME_8_30
         assert measurement.value == 100.0
         assert measurement.unit == "kg"
     
@@ -30,306 +92,256 @@ class TestBaseMeasurement:
         """Test that negative value raises ValidationError."""
         with pytest.raises(ValidationError) as exc_info:
             BaseMeasurement(
-                measurement_date=date(2023, 10, 1),
-                measurement_time=timedelta(hours=8, minutes=30),
+                measurement_date=_DATE,
+                measurement_time=_TIME_8_30,
                 value=-10.0,
                 unit="kg"
             )
-        assert "Measurement value must be non-negative" in str(exc_info.value)
+        assert any(
+            "Measurement value must be non-negative" in e["msg"]
+            for e in exc_info.value.errors()
+        )
     
     def test_zero_value_is_valid(self):
         """Test that zero value is valid."""
         measurement = BaseMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
             value=0.0,
             unit="kg"
         )
         assert measurement.value == 0.0
 
+    def test_measurement_is_immutable(self):
+        """Test that fields cannot be reassigned after creation."""
+        measurement = BaseMeasurement(
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
+            value=100.0,
+            unit="kg"
+        )
+        with pytest.raises(ValidationError):
+            measurement.value = 50.0
+
+    def test_extra_fields_raise_error(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValidationError):
+            BaseMeasurement(
+                measurement_date=_DATE,
+                measurement_time=_TIME_8_30,
+                value=100.0,
+                unit="kg",
+                source="scale"
+            )
+
 
 class TestWeightMeasurement:
     """Tests for WeightMeasurement class."""
     
-    def test_create_weight_measurement_kg(self):
-        """Test creating a weight measurement in kilograms."""
+    @pytest.mark.parametrize("value,unit", [(70.5, "kg"), (100.0, "lb"), (70.5, "g")])
+    def test_create_weight_measurement(self, value, unit):
+        """Test creating a weight measurement in each supported unit."""
         weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=70.5,
-            unit="kg"
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
+            value=value,
+            unit=unit
         )
-        assert weight.value == 70.5
-        assert weight.unit == "kg"
-    
-    def test_create_weight_measurement_lb(self):
-        """Test creating a weight measurement in pounds."""
-        weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=100.0,
-            unit="lb"
-        )
-        assert weight.value == 100.0
-        assert weight.unit == "lb"
-    
-    def test_create_weight_measurement_g(self):
-        """Test creating a weight measurement in grams."""
-        weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=70.5,
-            unit="g"
-        )
-        assert weight.value == 70.5
-        assert weight.unit == "g"
+        assert weight.value == value
+        assert weight.unit == unit
     
     def test_default_unit_is_kg(self):
         """Test that default unit is kg."""
         weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
             value=70.5
         )
         assert weight.unit == "kg"
-    
-    def test_invalid_unit_raises_error(self):
-        """Test that invalid unit raises ValidationError."""
-        with pytest.raises(ValidationError):
-            WeightMeasurement(
-                measurement_date=date(2023, 10, 1),
-                measurement_time=timedelta(hours=8, minutes=30),
-                value=70.5,
-                unit="ton"
-            )
-    
-    def test_value_below_minimum_raises_error(self):
-        """Test that value below 0.5 raises ValidationError."""
-        with pytest.raises(ValidationError):
-            WeightMeasurement(
-                measurement_date=date(2023, 10, 1),
-                measurement_time=timedelta(hours=8, minutes=30),
-                value=0.4,
-                unit="kg"
-            )
-    
-    def test_value_above_maximum_raises_error(self):
-        """Test that value above 150 raises ValidationError."""
-        with pytest.raises(ValidationError):
-            WeightMeasurement(
-                measurement_date=date(2023, 10, 1),
-                measurement_time=timedelta(hours=8, minutes=30),
-                value=151.0,
-                unit="kg"
-            )
-    
-    def test_convert_kg_to_kg(self):
-        """Test converting kg to kg returns same value."""
+
+    def test_unit_enum_member_stored_as_value(self):
+        """Test that a MassUnit member is accepted and stored as its plain value."""
         weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=70.0,
-            unit="kg"
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
+            value=100.0,
+            unit=MassUnit.LB
         )
-        assert weight.convert_to_kg() == 70.0
+        assert type(weight.unit) is str
+        assert weight.unit == "lb"
     
-    def test_convert_lb_to_kg(self):
-        """Test converting pounds to kilograms."""
+    def test_unit_is_interned(self):
+        """Test that a unit built at runtime is stored as the interned string."""
         weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
             value=100.0,
-            unit="lb"
+            unit="".join(["l", "b"])
         )
-        # 100 lb = 45.3592 kg
-        assert abs(weight.convert_to_kg() - 45.3592) < 0.001
+        assert weight.unit is sys.intern("lb")
+
+    @pytest.mark.parametrize("value,unit", [
+        (70.5, "ton"),  # invalid unit
+        (0.4, "kg"),  # below minimum of 0.5
+        (151.0, "kg"),  # above maximum of 150
+    ])
+    def test_invalid_weight_raises_error(self, value, unit):
+        """Test that an invalid unit or out-of-range value raises ValidationError."""
+        with pytest.raises(ValidationError):
+            WeightMeasurement(
+                measurement_date=_DATE,
+                measurement_time=_TIME_8_30,
+                value=value,
+                unit=unit
+            )
     
-    def test_convert_g_to_kg(self):
-        """Test converting grams to kilograms."""
+    @pytest.mark.parametrize("value,unit,expected_kg", [
+        (70.0, "kg", 70.0),
+        (100.0, "lb", 45.3592),
+        (5.0, "g", 0.005),
+    ])
+    def test_convert_to_kg(self, value, unit, expected_kg):
+        """Test converting each supported unit to kilograms."""
         weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=5.0,
-            unit="g"
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
+            value=value,
+            unit=unit
         )
-        assert weight.convert_to_kg() == 0.005
-    
-    def test_set_unit_to_kg_from_lb(self):
-        """Test setting unit to kg converts value from pounds."""
+        assert weight.convert_to_kg() == pytest.approx(expected_kg, abs=_TOL)
+
+    def test_convert_unsupported_unit_raises_error(self):
+        """Test converting an unvalidated, unsupported unit raises ValueError."""
+        weight = WeightMeasurement.model_construct(
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
+            value=1.0,
+            unit="ton"
+        )
+        msg = "Unsupported unit for weight conversion: ton"
+        with pytest.raises(ValueError, match=msg):
+            weight.convert_to_kg()
+    
+    def test_to_kg_from_lb(self):
+        """Test that to_kg returns a copy converted from pounds."""
         weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
             value=100.0,
             unit="lb"
         )
-        weight.set_unit_to_kg()
-        assert weight.unit == "kg"
-        assert abs(weight.value - 45.3592) < 0.001
+        converted = weight.to_kg()
+        assert converted.unit == "kg"
+        assert converted.value == pytest.approx(45.3592, abs=_TOL)
+        assert weight.unit == "lb"
+        assert weight.value == 100.0
     
-    def test_set_unit_to_kg_when_already_kg(self):
-        """Test setting unit to kg when already in kg doesn't change value."""
+    def test_to_kg_when_already_kg(self):
+        """Test that to_kg returns the instance itself when already in kg."""
         weight = WeightMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
             value=70.0,
             unit="kg"
         )
-        weight.set_unit_to_kg()
-        assert weight.unit == "kg"
-        assert weight.value == 70.0
+        assert weight.to_kg() is weight
 
 
 class TestLengthMeasurement:
     """Tests for LengthMeasurement class."""
     
-    def test_create_length_measurement_cm(self):
-        """Test creating a length measurement in centimeters."""
+    @pytest.mark.parametrize("value,unit", [
+        (180.0, "cm"),
+        (180.0, "m"),
+        (70.0, "in"),
+        (60.0, "ft"),
+    ])
+    def test_create_length_measurement(self, value, unit):
+        """Test creating a length measurement in each supported unit."""
         length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
-            value=180.0,
-            unit="cm"
+            measurement_date=_DATE,
+            measurement_time=_TIME_9_00,
+            value=value,
+            unit=unit
         )
-        assert length.value == 180.0
-        assert length.unit == "cm"
-    
-    def test_create_length_measurement_m(self):
-        """Test creating a length measurement in meters."""
-        length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
-            value=180.0,
-            unit="m"
-        )
-        assert length.value == 180.0
-        assert length.unit == "m"
-    
-    def test_create_length_measurement_in(self):
-        """Test creating a length measurement in inches."""
-        length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
-            value=70.0,
-            unit="in"
-        )
-        assert length.value == 70.0
-        assert length.unit == "in"
-    
-    def test_create_length_measurement_ft(self):
-        """Test creating a length measurement in feet."""
-        length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
-            value=60.0,
-            unit="ft"
-        )
-        assert length.value == 60.0
-        assert length.unit == "ft"
+        assert length.value == value
+        assert length.unit == unit
     
     def test_default_unit_is_cm(self):
         """Test that default unit is cm."""
         length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
+            measurement_date=_DATE,
+            measurement_time=_TIME_9_00,
             value=180.0
         )
         assert length.unit == "cm"
     
-    def test_invalid_unit_raises_error(self):
-        """Test that invalid unit raises ValidationError."""
-        with pytest.raises(ValidationError):
-            LengthMeasurement(
-                measurement_date=date(2023, 10, 1),
-                measurement_time=timedelta(hours=9, minutes=0),
-                value=180.0,
-                unit="km"
-            )
-    
-    def test_value_below_minimum_raises_error(self):
-        """Test that value below 30 raises ValidationError."""
-        with pytest.raises(ValidationError):
-            LengthMeasurement(
-                measurement_date=date(2023, 10, 1),
-                measurement_time=timedelta(hours=9, minutes=0),
-                value=25.0,
-                unit="cm"
-            )
-    
-    def test_value_above_maximum_raises_error(self):
-        """Test that value above 300 raises ValidationError."""
+    @pytest.mark.parametrize("value,unit", [
+        (180.0, "km"),  # invalid unit
+        (25.0, "cm"),  # below minimum of 30
+        (301.0, "cm"),  # above maximum of 300
+    ])
+    def test_invalid_length_raises_error(self, value, unit):
+        """Test that an invalid unit or out-of-range value raises ValidationError."""
         with pytest.raises(ValidationError):
             LengthMeasurement(
-                measurement_date=date(2023, 10, 1),
-                measurement_time=timedelta(hours=9, minutes=0),
-                value=301.0,
-                unit="cm"
+                measurement_date=_DATE,
+                measurement_time=_TIME_9_00,
+                value=value,
+                unit=unit
             )
     
-    def test_convert_cm_to_cm(self):
-        """Test converting cm to cm returns same value."""
-        length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
-            value=180.0,
-            unit="cm"
-        )
-        assert length.convert_to_cm() == 180.0
-    
-    def test_convert_m_to_cm(self):
-        """Test converting meters to centimeters."""
-        length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
-            value=180.0,
-            unit="m"
-        )
-        assert length.convert_to_cm() == 18000.0
-    
-    def test_convert_in_to_cm(self):
-        """Test converting inches to centimeters."""
+    @pytest.mark.parametrize("value,unit,expected_cm", [
+        (180.0, "cm", 180.0),
+        (180.0, "m", 18000.0),
+        (70.0, "in", 177.8),
+        (60.0, "ft", 1828.8),
+    ])
+    def test_convert_to_cm(self, value, unit, expected_cm):
+        """Test converting each supported unit to centimeters."""
         length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
-            value=70.0,
-            unit="in"
+            measurement_date=_DATE,
+            measurement_time=_TIME_9_00,
+            value=value,
+            unit=unit
         )
-        # 70 in = 177.8 cm
-        assert abs(length.convert_to_cm() - 177.8) < 0.001
-    
-    def test_convert_ft_to_cm(self):
-        """Test converting feet to centimeters."""
-        length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
-            value=60.0,
-            unit="ft"
-        )
-        # 60 ft = 1828.8 cm
-        assert abs(length.convert_to_cm() - 1828.8) < 0.001
-    
-    def test_set_unit_to_cm_from_m(self):
-        """Test setting unit to cm converts value from meters."""
+        assert length.convert_to_cm() == pytest.approx(expected_cm, abs=_TOL)
+
+    def test_convert_unsupported_unit_raises_error(self):
+        """Test converting an unvalidated, unsupported unit raises ValueError."""
+        length = LengthMeasurement.model_construct(
+            measurement_date=_DATE,
+            measurement_time=_TIME_9_00,
+            value=1.0,
+            unit="km"
+        )
+        msg = "Unsupported unit for length conversion: km"
+        with pytest.raises(ValueError, match=msg):
+            length.convert_to_cm()
+    
+    def test_to_cm_from_m(self):
+        """Test that to_cm returns a copy converted from meters."""
         length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
+            measurement_date=_DATE,
+            measurement_time=_TIME_9_00,
             value=180.0,
             unit="m"
         )
-        length.set_unit_to_cm()
-        assert length.unit == "cm"
-        assert length.value == 18000.0
+        converted = length.to_cm()
+        assert converted.unit == "cm"
+        assert converted.value == 18000.0
+        assert length.unit == "m"
+        assert length.value == 180.0
     
-    def test_set_unit_to_cm_when_already_cm(self):
-        """Test setting unit to cm when already in cm doesn't change value."""
+    def test_to_cm_when_already_cm(self):
+        """Test that to_cm returns the instance itself when already in cm."""
         length = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=9, minutes=0),
+            measurement_date=_DATE,
+            measurement_time=_TIME_9_00,
             value=180.0,
             unit="cm"
         )
-        length.set_unit_to_cm()
-        assert length.unit == "cm"
-        assert length.value == 180.0
+        assert length.to_cm() is length
 
 
 class TestBodyShapeMeasurements:
@@ -337,50 +349,11 @@ class TestBodyShapeMeasurements:
     
     def test_create_with_all_measurements(self):
         """Test creating BodyShapeMeasurements with all fields."""
-        neck = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=40.0,
-            unit="cm"
-        )
-        waist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=80.0,
-            unit="cm"
-        )
-        hip = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=90.0,
-            unit="cm"
-        )
-        wrist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=38.0,
-            unit="cm"
-        )
-        forearm = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=30.0,
-            unit="cm"
-        )
-        
-        body = BodyShapeMeasurements(
-            neck_circumference=neck,
-            waist_circumference=waist,
-            hip_circumference=hip,
-            wrist_circumference=wrist,
-            forearm_circumference=forearm
-        )
-        
-        assert body.neck_circumference == neck
-        assert body.waist_circumference == waist
-        assert body.hip_circumference == hip
-        assert body.wrist_circumference == wrist
-        assert body.forearm_circumference == forearm
+        assert _VALID_BODY.neck_circumference is _NECK
+        assert _VALID_BODY.waist_circumference is _WAIST
+        assert _VALID_BODY.hip_circumference is _HIP
+        assert _VALID_BODY.wrist_circumference is _WRIST
+        assert _VALID_BODY.forearm_circumference is _FOREARM
     
     def test_create_with_no_measurements(self):
         """Test creating BodyShapeMeasurements with all fields as None."""
@@ -393,146 +366,88 @@ class TestBodyShapeMeasurements:
     
     def test_create_with_partial_measurements(self):
         """Test creating BodyShapeMeasurements with some fields."""
-        waist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=80.0,
-            unit="cm"
-        )
-        
-        body = BodyShapeMeasurements(waist_circumference=waist)
-        
-        assert body.waist_circumference == waist
-        assert body.neck_circumference is None
-        assert body.hip_circumference is None
-    
-    def test_neck_circumference_validation_too_small(self):
-        """Test that neck circumference below 8 cm raises error."""
-        # Values below 30 are caught by LengthMeasurement validation
-        # Test with exactly 30 cm which passes LengthMeasurement but is valid for neck (8-60)
-        neck = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=30.0,
-            unit="cm"
-        )
-        # This should pass since 30 is between 8 and 60
-        body = BodyShapeMeasurements(neck_circumference=neck)
-        assert body.neck_circumference is not None
-    
-    def test_neck_circumference_validation_too_large(self):
-        """Test that neck circumference above 60 cm raises error."""
-        neck = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=61.0,
-            unit="cm"
-        )
-        
-        with pytest.raises(ValidationError) as exc_info:
-            BodyShapeMeasurements(neck_circumference=neck)
-        assert "Neck circumference must be between 8 cm and 60 cm" in str(exc_info.value)
-    
-    def test_waist_circumference_validation_too_small(self):
-        """Test that waist circumference below 20 cm raises error."""
-        # LengthMeasurement minimum is 30, so waist validation of >=20 is redundant
-        # Test boundary case at minimum valid LengthMeasurement
-        waist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=30.0,
-            unit="cm"
-        )
-        body = BodyShapeMeasurements(waist_circumference=waist)
-        assert body.waist_circumference is not None
-    
-    def test_waist_circumference_validation_too_large(self):
-        """Test that waist circumference above 150 cm raises error."""
-        waist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=151.0,
-            unit="cm"
-        )
-        
+        assert _PARTIAL_BODY.waist_circumference is _WAIST
+        assert _PARTIAL_BODY.neck_circumference is None
+        assert _PARTIAL_BODY.hip_circumference is None
+    
+    @pytest.mark.parametrize("field,value", [
+        ("neck_circumference", 7.9),
+        ("waist_circumference", 19.9),
+        ("hip_circumference", 19.9),
+        ("wrist_circumference", 4.9),
+    ])
+    def test_lower_bound_rejected(self, field, value):
+        """Test that a circumference just below the field's lower bound raises error."""
         with pytest.raises(ValidationError) as exc_info:
-            BodyShapeMeasurements(waist_circumference=waist)
-        assert "Waist circumference must be between 20 cm and 150 cm" in str(exc_info.value)
-    
-    def test_hip_circumference_validation_too_small(self):
-        """Test that hip circumference below 20 cm raises error."""
-        # LengthMeasurement minimum is 30, so hip validation of >=20 is redundant
-        # Test boundary case at minimum valid LengthMeasurement
-        hip = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=30.0,
-            unit="cm"
-        )
-        body = BodyShapeMeasurements(hip_circumference=hip)
-        assert body.hip_circumference is not None
-    
-    def test_hip_circumference_validation_too_large(self):
-        """Test that hip circumference above 200 cm raises error."""
-        hip = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=201.0,
-            unit="cm"
-        )
-        
+            BodyShapeMeasurements(**{field: _mk_length(value)})
+        assert any(_RANGE_MSGS[field] in e["msg"] for e in exc_info.value.errors())
+    
+    @pytest.mark.parametrize("field,key", [
+        ("neck_circumference", "neck61"),
+        ("waist_circumference", "waist151"),
+        ("hip_circumference", "hip201"),
+        ("wrist_circumference", "wrist41"),
+    ])
+    def test_upper_bound_rejected(self, lengths, field, key):
+        """Test that a circumference above the field's upper bound raises error."""
         with pytest.raises(ValidationError) as exc_info:
-            BodyShapeMeasurements(hip_circumference=hip)
-        assert "Hip circumference must be between 20 cm and 200 cm" in str(exc_info.value)
+            BodyShapeMeasurements(**{field: lengths[key]})
+        assert any(_RANGE_MSGS[field] in e["msg"] for e in exc_info.value.errors())
     
-    def test_wrist_circumference_validation_too_small(self):
-        """Test that wrist circumference below 5 cm raises error."""
-        # LengthMeasurement minimum is 30, so wrist validation of >=5 is redundant
-        # Test boundary case at minimum valid LengthMeasurement
-        wrist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=30.0,
-            unit="cm"
-        )
-        body = BodyShapeMeasurements(wrist_circumference=wrist)
-        assert body.wrist_circumference is not None
-    
-    def test_wrist_circumference_validation_too_large(self):
-        """Test that wrist circumference above 40 cm raises error."""
-        wrist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=41.0,
-            unit="cm"
-        )
-        
+    def test_every_out_of_range_field_reported(self, lengths):
+        """Test that all out-of-range fields are reported, each at its own loc."""
         with pytest.raises(ValidationError) as exc_info:
-            BodyShapeMeasurements(wrist_circumference=wrist)
-        assert "Wrist circumference must be between 5 cm and 40 cm" in str(exc_info.value)
+            BodyShapeMeasurements(
+                neck_circumference=lengths["neck61"],
+                wrist_circumference=lengths["wrist41"],
+            )
+        errors = exc_info.value.errors()
+        assert [e["loc"] for e in errors] == [
+            ("neck_circumference",),
+            ("wrist_circumference",),
+        ]
+        assert _RANGE_MSGS["neck_circumference"] in errors[0]["msg"]
+        assert _RANGE_MSGS["wrist_circumference"] in errors[1]["msg"]
     
     def test_measurements_converted_to_cm(self):
         """Test that measurements are automatically converted to cm."""
+        waist = _mk_length(30.0, "in")  # 30 in = 76.2 cm
+        
+        body = BodyShapeMeasurements(waist_circumference=waist)
+        
+        # Should be converted to cm
+        assert body.waist_circumference.unit == "cm"
+        assert body.waist_circumference.value == pytest.approx(76.2, abs=_TOL)
+
+    def test_conversion_leaves_input_unchanged(self):
+        """Test that converting to cm does not change the caller's hashable instance."""
         waist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
-            value=80.0,
-            unit="in"  # 80 inches = 203.2 cm, but too large for waist (max 150)
-        )
-        # Use a valid value: 30 in = 76.2 cm
-        waist = LengthMeasurement(
-            measurement_date=date(2023, 10, 1),
-            measurement_time=timedelta(hours=8, minutes=30),
+            measurement_date=_DATE,
+            measurement_time=_TIME_8_30,
             value=30.0,
             unit="in"
         )
-        
+        seen = {waist}
+        waist_hash = hash(waist)
+
         body = BodyShapeMeasurements(waist_circumference=waist)
-        
-        # Should be converted to cm
+
         assert body.waist_circumference.unit == "cm"
-        assert abs(body.waist_circumference.value - 76.2) < 0.1
-    
+        assert waist.unit == "in"
+        assert waist.value == 30.0
+        assert hash(waist) == waist_hash
+        assert waist in seen
+
+    def test_range_checked_after_conversion_to_cm(self):
+        """Test that circumference ranges are checked on the value in cm."""
+        # 30 inches = 76.2 cm, too large for neck (max 60)
+        neck = _mk_length(30.0, "in")
+
+        with pytest.raises(ValidationError) as exc_info:
+            BodyShapeMeasurements(neck_circumference=neck)
+        msg = _RANGE_MSGS["neck_circumference"]
+        assert any(msg in e["msg"] for e in exc_info.value.errors())
+
     def test_none_values_not_validated(self):
         """Test that None values skip validation."""
         # This should not raise any errors
@@ -542,3 +457,13 @@ class TestBodyShapeMeasurements:
         )
         assert body.neck_circumference is None
         assert body.waist_circumference is None
+
+    def test_body_shape_is_immutable(self):
+        """Test that measurements cannot be reassigned after creation."""
+        with pytest.raises(ValidationError):
+            _VALID_BODY.neck_circumference = None
+
+    def test_json_schema_includes_example(self):
+        """Test that the JSON schema carries an example for every field."""
+        example = BodyShapeMeasurements.model_json_schema()["examples"][0]
+        assert set(example) == set(BodyShapeMeasurements.model_fields)